@@ -1,271 +1,636 @@
 #!/usr/bin/env python3
+"""Render the app and tray icons.
+
+Run with ``python scripts/generate_icons.py``. Pillow is used when installed;
+set ICON_USE_NUMBA=1 to render the app icon with the Numba kernel instead.
+"""
 from __future__ import annotations
 
 import math
 import os
 import struct
 import zlib
-from dataclasses import dataclass
-
-
-@dataclass(frozen=True)
-class Color:
-    r: float
-    g: float
-    b: float
-
-    def mix(self, other: "Color", t: float) -> "Color":
-        t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
-        return Color(
-            self.r + (other.r - self.r) * t,
-            self.g + (other.g - self.g) * t,
-            self.b + (other.b - self.b) * t,
-        )
-
-
-def clamp01(x: float) -> float:
+from typing import Any, Callable, Iterable, Iterator, TypeVar, overload
+
+import numpy as np
+
+try:
+    from PIL import Image
+except ImportError:  # Optional; write_png_rgba falls back to its own encoder.
+    Image = None  # type: ignore[assignment]
+
+# The Numba kernel is opt-in with ICON_USE_NUMBA=1: a cold JIT compile takes
+# seconds, far longer than the NumPy render it replaces in a one-shot build.
+if os.environ.get("ICON_USE_NUMBA") == "1":
+    try:
+        import numba
+    except ImportError:  # Fall back to the NumPy renderer.
+        numba = None  # type: ignore[assignment]
+else:
+    numba = None  # type: ignore[assignment]
+
+prange = numba.prange if numba is not None else range
+
+
+# Colors are plain (r, g, b) tuples in 0..255. While rendering, each channel
+# is its own (H, W) array so mixes never broadcast over a trailing RGB axis.
+RGB = tuple[float, float, float]
+Planes = tuple[np.ndarray, np.ndarray, np.ndarray]
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Slightly brighter base so the icon pops in a crowded dock/taskbar.
+BG_A: RGB = (0x14, 0x1D, 0x2A)  # #141d2a
+BG_B: RGB = (0x0B, 0x12, 0x1A)  # #0b121a
+ACCENT: RGB = (0x7A, 0xA2, 0xF7)  # #7aa2f7
+ACCENT_2: RGB = (0x2A, 0xC3, 0xDE)  # #2ac3de
+WHITE: RGB = (255, 255, 255)
+BLACK: RGB = (0, 0, 0)
+
+# Rows per tile when rendering the app icon; keeps temporaries cache-sized.
+TILE_ROWS = 64
+
+# Samples per axis per output pixel when rendering the tray icon.
+TRAY_SUPERSAMPLE = 4
+
+# Conservative (u0, v0, u1, v1) bounds of the app icon glyph and sparkle,
+# shadows included. The antialias band widens as the icon shrinks, so callers
+# grow them by aa; outside that both masks are zero.
+APP_GLYPH_BBOX = (0.28, 0.28, 0.90, 0.72)
+APP_SPARK_BBOX = (0.76, 0.26, 0.92, 0.42)
+
+
+@overload
+def mix(a: RGB, b: RGB, t: float) -> RGB: ...
+@overload
+def mix(a: Planes, b: RGB | Planes, t: float) -> Planes: ...
+@overload
+def mix(a: RGB | Planes, b: RGB | Planes, t: np.ndarray) -> Planes: ...
+def mix(a: Any, b: Any, t: Any) -> Any:
+    # Works channel-wise on scalar colors and per-pixel planes alike.
+    t = clamp01(t)
+    return (
+        a[0] + (b[0] - a[0]) * t,
+        a[1] + (b[1] - a[1]) * t,
+        a[2] + (b[2] - a[2]) * t,
+    )
+
+
+@overload
+def clamp01(x: float) -> float: ...
+@overload
+def clamp01(x: np.ndarray) -> np.ndarray: ...
+def clamp01(x: Any) -> Any:
+    # Plain floats stay Python floats so constant mixes don't promote float32 planes.
+    if isinstance(x, np.ndarray):
+        return np.clip(x, 0.0, 1.0)
     return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
 
 
-def smoothstep(edge0: float, edge1: float, x: float) -> float:
+def smoothstep(edge0: float, edge1: float, x: np.ndarray) -> np.ndarray:
     if edge0 == edge1:
-        return 0.0
+        return np.zeros_like(x)
     t = clamp01((x - edge0) / (edge1 - edge0))
     return t * t * (3.0 - 2.0 * t)
 
 
-def dist_to_segment(px: float, py: float, ax: float, ay: float, bx: float, by: float) -> float:
+Segment = tuple[float, float, float, float, float, float, float]
+
+
+def _precompute_segment(ax: float, ay: float, bx: float, by: float) -> Segment:
+    # (ax, ay, vx, vy, 1 / |v|^2, bx, by): everything dist_to_segment_sq needs that
+    # doesn't depend on the sample point.
     vx = bx - ax
     vy = by - ay
+    return (ax, ay, vx, vy, 1.0 / (vx * vx + vy * vy), bx, by)
+
+
+def dist_to_segment_sq(px: np.ndarray, py: np.ndarray, seg: Segment) -> np.ndarray:
+    # Squared distance; callers compare against squared thresholds so most
+    # pixels never need a sqrt.
+    ax, ay, vx, vy, inv_c2, bx, by = seg
     wx = px - ax
     wy = py - ay
-    c1 = vx * wx + vy * wy
-    if c1 <= 0.0:
-        return math.hypot(wx, wy)
-    c2 = vx * vx + vy * vy
-    if c2 <= c1:
-        return math.hypot(px - bx, py - by)
-    t = c1 / c2
-    ix = ax + t * vx
-    iy = ay + t * vy
-    return math.hypot(px - ix, py - iy)
-
+    t = clamp01((vx * wx + vy * wy) * inv_c2)
+    dx = wx - t * vx
+    dy = wy - t * vy
+    return dx * dx + dy * dy
 
-def stroke_alpha(dist: float, half_thickness: float, aa: float) -> float:
-    # 1.0 inside, 0.0 outside with antialias band.
-    return 1.0 - smoothstep(half_thickness - aa, half_thickness + aa, dist)
 
+def stroke_alpha_sq(d2: np.ndarray, half_thickness: float, aa: float) -> np.ndarray:
+    # 1.0 inside, 0.0 outside with antialias band; only the band takes a sqrt.
+    lo = half_thickness - aa
+    hi = half_thickness + aa
+    alpha = (d2 < lo * lo).astype(d2.dtype) if lo > 0.0 else np.zeros_like(d2)
+    band = (d2 <= hi * hi) & (alpha == 0.0)
+    alpha[band] = 1.0 - smoothstep(lo, hi, np.sqrt(d2[band]))
+    return alpha
 
-def circle_alpha(px: float, py: float, cx: float, cy: float, radius: float, aa: float) -> float:
-    return stroke_alpha(math.hypot(px - cx, py - cy), radius, aa)
 
+# Prompt glyph geometry, normalized in [0..1]: chevron ">" then three dots "...".
+CHEVRON_SEG1 = _precompute_segment(0.34, 0.36, 0.49, 0.50)
+CHEVRON_SEG2 = _precompute_segment(0.34, 0.64, 0.49, 0.50)
+DOT_CENTERS_X = (0.62, 0.72, 0.82)
+DOT_CENTER_Y = 0.50
 
-def prompt_mark_alpha(u: float, v: float, thickness: float, dot_radius: float, aa: float) -> float:
-    # All coordinates normalized in [0..1]
-    # Chevron ">"
-    ax, ay = 0.34, 0.36
-    mx, my = 0.49, 0.50
-    bx, by = 0.34, 0.64
 
+def prompt_mark_alpha(
+    u: np.ndarray, v: np.ndarray, thickness: float, dot_radius: float, aa: float
+) -> np.ndarray:
     half = thickness / 2.0
-    d1 = dist_to_segment(u, v, ax, ay, mx, my)
-    d2 = dist_to_segment(u, v, bx, by, mx, my)
-    chevron = stroke_alpha(min(d1, d2), half, aa)
+    d1 = dist_to_segment_sq(u, v, CHEVRON_SEG1)
+    d2 = dist_to_segment_sq(u, v, CHEVRON_SEG2)
+    chevron = stroke_alpha_sq(np.minimum(d1, d2), half, aa)
+
+    # The dots share a radius and stroke_alpha_sq is monotone, so the nearest
+    # center alone decides coverage: one band evaluation instead of three.
+    dy2 = (v - DOT_CENTER_Y) * (v - DOT_CENTER_Y)
+    d2_min = np.minimum.reduce([(u - cx) * (u - cx) + dy2 for cx in DOT_CENTERS_X])
+    dots = stroke_alpha_sq(d2_min, dot_radius, aa)
+
+    return np.maximum(chevron, dots)
+
+
+def axis_segment_dist_sq(along: np.ndarray, across: np.ndarray, half_len: float) -> np.ndarray:
+    # Squared distance to an axis-aligned segment centered on the origin, given
+    # offsets along and across it; no projection or branches needed.
+    d = np.maximum(np.abs(along) - half_len, 0.0)
+    return d * d + across * across
+
+
+def diamond_alpha(
+    u: np.ndarray, v: np.ndarray, cx: float, cy: float, r: float, aa: float
+) -> np.ndarray:
+    d = np.abs(u - cx) + np.abs(v - cy)
+    return 1.0 - smoothstep(r - aa, r + aa, d)
+
+
+def sparkle_alpha(
+    u: np.ndarray,
+    v: np.ndarray,
+    cx: float,
+    cy: float,
+    size: float,
+    thickness: float,
+    aa: float,
+) -> np.ndarray:
+    du = u - cx
+    dv = v - cy
+    # Both strokes share a thickness, so one band evaluation over the nearer covers the cross.
+    d2 = np.minimum(axis_segment_dist_sq(du, dv, size), axis_segment_dist_sq(dv, du, size))
+    cross = stroke_alpha_sq(d2, thickness / 2.0, aa)
+    diamond = diamond_alpha(u, v, cx, cy, r=size * 0.55, aa=aa) * 0.9
+    return np.maximum(cross, diamond)
+
+
+def uv_grid(
+    width: int, height: int, y0: int = 0, y1: int | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    # Pixel-center coordinates normalized in [0..1], shaped (y1 - y0, W).
+    # float32 is plenty for 8-bit output and halves memory traffic; Python
+    # float constants are weakly typed, so everything downstream stays float32.
+    y1 = height if y1 is None else y1
+    u = (np.arange(width, dtype=np.float32) + 0.5) * np.float32(1.0 / width)
+    v = (np.arange(y0, y1, dtype=np.float32) + 0.5) * np.float32(1.0 / height)
+    return np.meshgrid(u, v)
+
+
+def bbox_region(
+    u: np.ndarray,
+    v: np.ndarray,
+    bbox: tuple[float, float, float, float],
+    margin: float = 0.0,
+) -> tuple[slice, slice]:
+    # (rows, cols) slices of a uv_grid covering bbox grown by margin; empty when
+    # they don't overlap.
+    u0, v0, u1, v1 = bbox[0] - margin, bbox[1] - margin, bbox[2] + margin, bbox[3] + margin
+    us = u[0]
+    vs = v[:, 0]
+    rows = slice(np.searchsorted(vs, v0), np.searchsorted(vs, v1, side="right"))
+    cols = slice(np.searchsorted(us, u0), np.searchsorted(us, u1, side="right"))
+    return rows, cols
+
+
+def area_average(x: np.ndarray, factor: int) -> np.ndarray:
+    # Box-filters an (H * factor, W * factor) plane down to (H, W).
+    height, width = x.shape[0] // factor, x.shape[1] // factor
+    return x.reshape(height, factor, width, factor).mean(axis=(1, 3))
+
+
+def to_rgba8(rgb: Planes, alpha: np.ndarray) -> np.ndarray:
+    # Interleave once, then round half up, clamp and narrow the whole image
+    # in place; cheaper than quantizing each plane into a strided uint8 view.
+    out = np.stack((*rgb, alpha), axis=-1)
+    out += 0.5
+    np.clip(out, 0.0, 255.0, out=out)
+    return out.astype(np.uint8)
+
+
+# Scanlines per block when filtering and deflating in the built-in encoder, and
+# the bands (every FILTER_SAMPLE_STRIDE-th run of FILTER_SAMPLE_ROWS rows)
+# sampled to decide whether filtering pays off at all.
+FILTER_BLOCK_ROWS = 16
+FILTER_SAMPLE_ROWS = 128
+FILTER_SAMPLE_STRIDE = 4
+
+# PNG framing: chunk length/CRC words and the IHDR payload
+# (width, height, bit depth, color type, compression, filter, interlace).
+_U32 = struct.Struct(">I")
+_IHDR = struct.Struct(">IIBBBBB")
+
+
+def filter_rows(rgba: np.ndarray, y0: int, y1: int) -> np.ndarray:
+    # Filters rows [y0, y1), picking a PNG filter per row with the usual
+    # minimum-sum-of-absolute-differences heuristic. Temporaries are int16 and
+    # sized by the block, not the image.
+    stride = rgba.shape[1] * 4
+    x = rgba[y0:y1].reshape(y1 - y0, stride).astype(np.int16)
+    b = np.zeros_like(x)  # up
+    b[1:] = x[:-1]
+    if y0 > 0:
+        b[0] = rgba[y0 - 1].reshape(stride)
+    a = np.zeros_like(x)  # left
+    a[:, 4:] = x[:, :-4]
+    c = np.zeros_like(x)  # up-left
+    c[:, 4:] = b[:, :-4]
+
+    p = a + b - c
+    pa = np.abs(p - a)
+    pb = np.abs(p - b)
+    pc = np.abs(p - c)
+    paeth = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+
+    raw = np.empty((y1 - y0, 1 + stride), dtype=np.uint8)
+    best = np.full(y1 - y0, np.iinfo(np.int64).max)
+    # Filter types 0..4: None, Sub, Up, Average, Paeth (all mod 256).
+    predictors: tuple[int | np.ndarray, ...] = (0, a, b, (a + b) >> 1, paeth)
+    for kind, pred in enumerate(predictors):
+        res = (x - pred) & 0xFF
+        # |res| as a signed byte, summed per row.
+        cost = np.minimum(res, 256 - res).sum(axis=1, dtype=np.int64)
+        better = cost < best
+        best[better] = cost[better]
+        raw[better, 0] = kind
+        raw[better, 1:] = res[better]
+    return raw
+
+
+def unfiltered_rows(rgba: np.ndarray, y0: int, y1: int) -> np.ndarray:
+    raw = np.zeros((y1 - y0, 1 + rgba.shape[1] * 4), dtype=np.uint8)
+    raw[:, 1:] = rgba[y0:y1].reshape(y1 - y0, -1)
+    return raw
+
+
+def scanline_blocks(
+    rgba: np.ndarray,
+    rows_fn: Callable[[np.ndarray, int, int], np.ndarray],
+    y0: int = 0,
+    y1: int | None = None,
+) -> Iterator[np.ndarray]:
+    # Yields rows [y0, y1) as blocks of FILTER_BLOCK_ROWS scanlines, built on demand.
+    y1 = rgba.shape[0] if y1 is None else y1
+    for y in range(y0, y1, FILTER_BLOCK_ROWS):
+        yield rows_fn(rgba, y, min(y + FILTER_BLOCK_ROWS, y1))
+
+
+def prefer_filtered(rgba: np.ndarray) -> bool:
+    # The minsum heuristic doesn't say whether filtering beats no filtering at
+    # all (on flat, coarsely quantized artwork it doesn't), so deflate a few
+    # bands both ways and compare. Bands must be tall enough to show the long
+    # flat runs that favour the unfiltered stream.
+    height = rgba.shape[0]
+    bands = [
+        (y, min(y + FILTER_SAMPLE_ROWS, height))
+        for y in range(0, height, FILTER_SAMPLE_ROWS * FILTER_SAMPLE_STRIDE)
+    ]
+
+    def sample_size(rows_fn: Callable[[np.ndarray, int, int], np.ndarray]) -> int:
+        return sum(
+            len(deflate_rows((b.data for b in scanline_blocks(rgba, rows_fn, y0, y1)), 1))
+            for y0, y1 in bands
+        )
 
-    # Three dots "..."
-    dots = 0.0
-    for cx in (0.62, 0.72, 0.82):
-        dots = max(dots, circle_alpha(u, v, cx, 0.50, dot_radius, aa))
+    return sample_size(filter_rows) < sample_size(unfiltered_rows)
 
-    return max(chevron, dots)
 
+def deflate_rows(rows: Iterable[bytes | memoryview], level: int) -> bytes:
+    # Streams scanline buffers through one compressor instead of joining them
+    # into a single raw image first.
+    co = zlib.compressobj(level)
+    parts = [co.compress(row) for row in rows]
+    parts.append(co.flush())
+    return b"".join(parts)
 
-def write_png_rgba(path: str, width: int, height: int, pixel_fn) -> None:
-    raw = bytearray()
-    for y in range(height):
-        raw.append(0)  # filter type 0
-        for x in range(width):
-            r, g, b, a = pixel_fn(x, y)
-            raw.extend((r, g, b, a))
 
-    compressed = zlib.compress(bytes(raw), level=9)
+def write_png_rgba(
+    path: str,
+    width: int,
+    height: int,
+    image_fn: Callable[[int, int], np.ndarray],
+    compress_level: int = zlib.Z_BEST_SPEED,
+) -> None:
+    rgba = image_fn(width, height)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if Image is not None:
+        # libpng/zlib in C beat the pure-Python encoder below by a wide margin.
+        Image.fromarray(rgba).save(path, format="PNG", compress_level=compress_level)
+        return
+
+    rows_fn = filter_rows if prefer_filtered(rgba) else unfiltered_rows
+    blocks = scanline_blocks(rgba, rows_fn)
+    compressed = deflate_rows((block.data for block in blocks), compress_level)
 
     def chunk(tag: bytes, data: bytes) -> bytes:
-        return (
-            struct.pack(">I", len(data))
-            + tag
-            + data
-            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+        # CRC the tag and payload incrementally instead of concatenating them.
+        crc = zlib.crc32(data, zlib.crc32(tag)) & 0xFFFFFFFF
+        return b"".join((_U32.pack(len(data)), tag, data, _U32.pack(crc)))
+
+    png = b"".join(
+        (
+            b"\x89PNG\r\n\x1a\n",
+            chunk(b"IHDR", _IHDR.pack(width, height, 8, 6, 0, 0, 0)),
+            chunk(b"IDAT", compressed),
+            chunk(b"IEND", b""),
         )
+    )
 
-    png = bytearray()
-    png.extend(b"\x89PNG\r\n\x1a\n")
-    png.extend(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)))
-    png.extend(chunk(b"IDAT", compressed))
-    png.extend(chunk(b"IEND", b""))
-
-    os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "wb") as f:
         f.write(png)
 
 
-def build_app_icon(path: str, size: int = 1024) -> None:
-    # Slightly brighter base so the icon pops in a crowded dock/taskbar.
-    bg_a = Color(0x14, 0x1D, 0x2A)  # #141d2a
-    bg_b = Color(0x0B, 0x12, 0x1A)  # #0b121a
-    accent = Color(0x7A, 0xA2, 0xF7)  # #7aa2f7
-    accent_2 = Color(0x2A, 0xC3, 0xDE)  # #2ac3de
-    white = Color(255, 255, 255)
-    black = Color(0, 0, 0)
-
-    inv = 1.0 / float(size)
+def render_background(u: np.ndarray, v: np.ndarray) -> Planes:
+    # Background: subtle diagonal gradient + two soft glows.
+    t = (u + v) * 0.5
+    base = mix(BG_A, BG_B, t)
+
+    def glow(cx: float, cy: float, strength: float, col: RGB) -> Planes:
+        dx = u - cx
+        dy = v - cy
+        d2 = dx * dx + dy * dy
+        # Cheap falloff that stays smooth.
+        g = 1.0 / (1.0 + d2 / 0.025)
+        return mix(base, col, g * strength)
+
+    base = glow(0.24, 0.22, 0.50, ACCENT)
+    base = glow(0.78, 0.80, 0.38, ACCENT_2)
+
+    # Gentle vignette.
+    dx = u - 0.5
+    dy = v - 0.5
+    vignette = clamp01((dx * dx + dy * dy) / 0.35)
+    base = mix(base, BLACK, vignette * 0.14)
+
+    # Subtle edge highlight to improve recognizability at small sizes.
+    edge = np.minimum(np.minimum(u, v), np.minimum(1.0 - u, 1.0 - v))
+    edge_glow = 1.0 - smoothstep(0.0, 0.028, edge)
+    return mix(base, mix(ACCENT, ACCENT_2, 0.5), edge_glow * 0.08)
+
+
+def apply_foreground(base: Planes, u: np.ndarray, v: np.ndarray, size: int) -> np.ndarray:
+    # Composites the glyph, sparkle and their shadows over a rendered background.
+    # Prompt glyph with subtle shadow. Masks are only evaluated inside their
+    # bounding boxes and stay zero elsewhere.
+    aa = 1.2 * (1.0 / float(size))
+    shadow = np.zeros_like(u)
+    glyph = np.zeros_like(u)
+    gr = bbox_region(u, v, APP_GLYPH_BBOX, aa)
+    gu, gv = u[gr], v[gr]
+    shadow[gr] = prompt_mark_alpha(gu + 0.010, gv + 0.012, thickness=0.084, dot_radius=0.033, aa=aa)
+    glyph[gr] = prompt_mark_alpha(gu, gv, thickness=0.078, dot_radius=0.031, aa=aa)
+
+    # Small "spark" to hint at AI.
+    spark_shadow = np.zeros_like(u)
+    spark = np.zeros_like(u)
+    sr = bbox_region(u, v, APP_SPARK_BBOX, aa)
+    su, sv = u[sr], v[sr]
+    spark_shadow[sr] = sparkle_alpha(
+        su + 0.010,
+        sv + 0.012,
+        cx=0.84,
+        cy=0.34,
+        size=0.050,
+        thickness=0.018,
+        aa=aa,
+    )
+    spark[sr] = sparkle_alpha(
+        su,
+        sv,
+        cx=0.84,
+        cy=0.34,
+        size=0.048,
+        thickness=0.016,
+        aa=aa,
+    )
+
+    out = base
+    out = mix(out, BLACK, shadow * 0.28)
+    out = mix(out, BLACK, spark_shadow * 0.24)
+
+    # Gradient glyph (subtle) from accent to accent_2.
+    gt = clamp01((u - 0.30) / 0.55)
+    fg = mix(mix(ACCENT, ACCENT_2, gt), WHITE, 0.26)
+    out = mix(out, fg, glyph)
+
+    spark_col = mix(mix(ACCENT_2, ACCENT, 0.25), WHITE, 0.70)
+    out = mix(out, spark_col, spark)
+
+    return to_rgba8(out, np.full_like(u, 255.0))
+
+
+def render_tile(y0: int, y1: int, size: int) -> np.ndarray:
+    # Renders rows [y0, y1) of the app icon.
+    u, v = uv_grid(size, size, y0, y1)
+    return apply_foreground(render_background(u, v), u, v, size)
+
+
+USE_NUMBA = numba is not None
+
+
+def _jit(**options: Any) -> Callable[[F], F]:
+    # njit when numba can be used, otherwise leave the function as it is.
+    def wrap(fn: F) -> F:
+        return numba.njit(**options)(fn) if USE_NUMBA else fn
+
+    return wrap
+
+
+@_jit()
+def _clamp01_px(x: float) -> float:
+    return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
 
-    def diamond_alpha(u: float, v: float, cx: float, cy: float, r: float, aa: float) -> float:
-        d = abs(u - cx) + abs(v - cy)
-        return 1.0 - smoothstep(r - aa, r + aa, d)
-
-    def sparkle_alpha(
-        u: float,
-        v: float,
-        cx: float,
-        cy: float,
-        size: float,
-        thickness: float,
-        aa: float,
-    ) -> float:
-        half = thickness / 2.0
-        h = stroke_alpha(dist_to_segment(u, v, cx - size, cy, cx + size, cy), half, aa)
-        vert = stroke_alpha(dist_to_segment(u, v, cx, cy - size, cx, cy + size), half, aa)
-        diamond = diamond_alpha(u, v, cx, cy, r=size * 0.55, aa=aa) * 0.9
-        return max(h, vert, diamond)
-
-    def pixel(x: int, y: int):
-        u = (x + 0.5) * inv
-        v = (y + 0.5) * inv
 
-        # Background: subtle diagonal gradient + two soft glows.
-        t = (u + v) * 0.5
-        base = bg_a.mix(bg_b, t)
-
-        def glow(cx: float, cy: float, strength: float, col: Color) -> Color:
-            dx = u - cx
-            dy = v - cy
-            d2 = dx * dx + dy * dy
-            # Cheap falloff that stays smooth.
-            g = 1.0 / (1.0 + d2 / 0.025)
-            return base.mix(col, clamp01(g * strength))
-
-        base = glow(0.24, 0.22, 0.50, accent)
-        base = glow(0.78, 0.80, 0.38, accent_2)
-
-        # Gentle vignette.
-        dx = u - 0.5
-        dy = v - 0.5
-        vignette = clamp01((dx * dx + dy * dy) / 0.35)
-        base = base.mix(black, vignette * 0.14)
-
-        # Subtle edge highlight to improve recognizability at small sizes.
-        edge = min(u, v, 1.0 - u, 1.0 - v)
-        edge_glow = 1.0 - smoothstep(0.0, 0.028, edge)
-        base = base.mix(accent.mix(accent_2, 0.5), edge_glow * 0.08)
-
-        # Prompt glyph with subtle shadow.
-        aa = 1.2 * inv
-        shadow = prompt_mark_alpha(u + 0.010, v + 0.012, thickness=0.084, dot_radius=0.033, aa=aa)
-        glyph = prompt_mark_alpha(u, v, thickness=0.078, dot_radius=0.031, aa=aa)
-
-        # Small "spark" to hint at AI.
-        spark_shadow = sparkle_alpha(
-            u + 0.010,
-            v + 0.012,
-            cx=0.84,
-            cy=0.34,
-            size=0.050,
-            thickness=0.018,
-            aa=aa,
-        )
-        spark = sparkle_alpha(
-            u,
-            v,
-            cx=0.84,
-            cy=0.34,
-            size=0.048,
-            thickness=0.016,
-            aa=aa,
-        )
+@_jit()
+def _smoothstep_px(edge0: float, edge1: float, x: float) -> float:
+    if edge0 == edge1:
+        return 0.0
+    t = _clamp01_px((x - edge0) / (edge1 - edge0))
+    return t * t * (3.0 - 2.0 * t)
 
-        out = base
-        if shadow > 0.0:
-            out = out.mix(black, clamp01(shadow * 0.28))
 
-        if spark_shadow > 0.0:
-            out = out.mix(black, clamp01(spark_shadow * 0.24))
+@_jit()
+def _in_bbox_px(
+    u: float, v: float, bbox: tuple[float, float, float, float], margin: float
+) -> bool:
+    return (
+        bbox[0] - margin <= u <= bbox[2] + margin and bbox[1] - margin <= v <= bbox[3] + margin
+    )
 
-        if glyph > 0.0:
-            # Gradient glyph (subtle) from accent to accent_2.
-            gt = clamp01((u - 0.30) / 0.55)
-            fg = accent.mix(accent_2, gt).mix(white, 0.26)
-            out = out.mix(fg, glyph)
 
-        if spark > 0.0:
-            spark_col = accent_2.mix(accent, 0.25).mix(white, 0.70)
-            out = out.mix(spark_col, spark)
+@_jit()
+def _mix_px(a: RGB, b: RGB, t: float) -> RGB:
+    t = _clamp01_px(t)
+    return (a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t, a[2] + (b[2] - a[2]) * t)
 
-        return (int(out.r + 0.5), int(out.g + 0.5), int(out.b + 0.5), 255)
 
-    write_png_rgba(path, size, size, pixel)
+@_jit()
+def _dist_to_segment_sq_px(px: float, py: float, seg: Segment) -> float:
+    ax, ay, vx, vy, inv_c2, bx, by = seg
+    wx = px - ax
+    wy = py - ay
+    t = _clamp01_px((vx * wx + vy * wy) * inv_c2)
+    dx = wx - t * vx
+    dy = wy - t * vy
+    return dx * dx + dy * dy
 
 
-def build_tray_icon(path: str, size: int = 32) -> None:
-    accent = Color(0x7A, 0xA2, 0xF7)
-    accent_2 = Color(0x2A, 0xC3, 0xDE)
-    white = Color(255, 255, 255)
+@_jit()
+def _stroke_alpha_sq_px(d2: float, half_thickness: float, aa: float) -> float:
+    lo = half_thickness - aa
+    hi = half_thickness + aa
+    if d2 > hi * hi:
+        return 0.0
+    if lo > 0.0 and d2 < lo * lo:
+        return 1.0
+    return 1.0 - _smoothstep_px(lo, hi, math.sqrt(d2))
+
+
+@_jit()
+def _prompt_mark_alpha_px(u: float, v: float, thickness: float, dot_radius: float, aa: float) -> float:
+    d1 = _dist_to_segment_sq_px(u, v, CHEVRON_SEG1)
+    d2 = _dist_to_segment_sq_px(u, v, CHEVRON_SEG2)
+    alpha = _stroke_alpha_sq_px(min(d1, d2), thickness / 2.0, aa)
+    dy2 = (v - DOT_CENTER_Y) * (v - DOT_CENTER_Y)
+    d2_min = math.inf
+    for cx in DOT_CENTERS_X:
+        d2_min = min(d2_min, (u - cx) * (u - cx) + dy2)
+    return max(alpha, _stroke_alpha_sq_px(d2_min, dot_radius, aa))
+
+
+@_jit()
+def _axis_segment_dist_sq_px(along: float, across: float, half_len: float) -> float:
+    d = max(abs(along) - half_len, 0.0)
+    return d * d + across * across
+
+
+@_jit()
+def _sparkle_alpha_px(
+    u: float, v: float, cx: float, cy: float, size: float, thickness: float, aa: float
+) -> float:
+    du = u - cx
+    dv = v - cy
+    d2 = min(_axis_segment_dist_sq_px(du, dv, size), _axis_segment_dist_sq_px(dv, du, size))
+    r = size * 0.55
+    diamond = (1.0 - _smoothstep_px(r - aa, r + aa, abs(du) + abs(dv))) * 0.9
+    return max(_stroke_alpha_sq_px(d2, thickness / 2.0, aa), diamond)
+
+
+@_jit(parallel=True, fastmath=True, cache=True)
+def render_app(size: int) -> np.ndarray:
+    # Scalar twin of render_tile, compiled to native code with rows spread over threads.
+    out = np.empty((size, size, 4), np.uint8)
     inv = 1.0 / float(size)
-
-    def diamond_alpha(u: float, v: float, cx: float, cy: float, r: float, aa: float) -> float:
-        d = abs(u - cx) + abs(v - cy)
-        return 1.0 - smoothstep(r - aa, r + aa, d)
-
-    def sparkle_alpha(
-        u: float,
-        v: float,
-        cx: float,
-        cy: float,
-        size: float,
-        thickness: float,
-        aa: float,
-    ) -> float:
-        half = thickness / 2.0
-        h = stroke_alpha(dist_to_segment(u, v, cx - size, cy, cx + size, cy), half, aa)
-        vert = stroke_alpha(dist_to_segment(u, v, cx, cy - size, cx, cy + size), half, aa)
-        diamond = diamond_alpha(u, v, cx, cy, r=size * 0.55, aa=aa) * 0.9
-        return max(h, vert, diamond)
-
-    def pixel(x: int, y: int):
-        u = (x + 0.5) * inv
+    aa = 1.2 * inv
+    edge_col = _mix_px(ACCENT, ACCENT_2, 0.5)
+    spark_col = _mix_px(_mix_px(ACCENT_2, ACCENT, 0.25), WHITE, 0.70)
+    for y in prange(size):
         v = (y + 0.5) * inv
-        aa = 1.0 * inv
+        for x in range(size):
+            u = (x + 0.5) * inv
+
+            base = _mix_px(BG_A, BG_B, (u + v) * 0.5)
+            d2 = (u - 0.24) * (u - 0.24) + (v - 0.22) * (v - 0.22)
+            base = _mix_px(base, ACCENT, 0.50 / (1.0 + d2 / 0.025))
+            d2 = (u - 0.78) * (u - 0.78) + (v - 0.80) * (v - 0.80)
+            base = _mix_px(base, ACCENT_2, 0.38 / (1.0 + d2 / 0.025))
+            d2 = (u - 0.5) * (u - 0.5) + (v - 0.5) * (v - 0.5)
+            base = _mix_px(base, BLACK, _clamp01_px(d2 / 0.35) * 0.14)
+            edge = min(u, v, 1.0 - u, 1.0 - v)
+            base = _mix_px(base, edge_col, (1.0 - _smoothstep_px(0.0, 0.028, edge)) * 0.08)
+
+            shadow = glyph = spark_shadow = spark = 0.0
+            if _in_bbox_px(u, v, APP_GLYPH_BBOX, aa):
+                shadow = _prompt_mark_alpha_px(u + 0.010, v + 0.012, 0.084, 0.033, aa)
+                glyph = _prompt_mark_alpha_px(u, v, 0.078, 0.031, aa)
+            if _in_bbox_px(u, v, APP_SPARK_BBOX, aa):
+                spark_shadow = _sparkle_alpha_px(u + 0.010, v + 0.012, 0.84, 0.34, 0.050, 0.018, aa)
+                spark = _sparkle_alpha_px(u, v, 0.84, 0.34, 0.048, 0.016, aa)
+
+            col = _mix_px(base, BLACK, shadow * 0.28)
+            col = _mix_px(col, BLACK, spark_shadow * 0.24)
+            fg = _mix_px(_mix_px(ACCENT, ACCENT_2, (u - 0.30) / 0.55), WHITE, 0.26)
+            col = _mix_px(col, fg, glyph)
+            col = _mix_px(col, spark_col, spark)
+
+            out[y, x, 0] = int(col[0] + 0.5)
+            out[y, x, 1] = int(col[1] + 0.5)
+            out[y, x, 2] = int(col[2] + 0.5)
+            out[y, x, 3] = 255
+    return out
+
+
+def build_app_icon(
+    path: str, size: int = 1024, compress_level: int = zlib.Z_BEST_SPEED
+) -> None:
+    def render(width: int, height: int) -> np.ndarray:
+        if USE_NUMBA:
+            return render_app(width)
+        # Rendering in row tiles keeps the float32 temporaries small; a process
+        # pool cost more in startup and pickling than it saved at 1024 px.
+        return np.concatenate(
+            [render_tile(y, min(y + TILE_ROWS, height), width) for y in range(0, height, TILE_ROWS)]
+        )
+
+    write_png_rgba(path, size, size, render, compress_level)
+
+
+def build_tray_icon(
+    path: str, size: int = 32, compress_level: int = zlib.Z_BEST_SPEED
+) -> None:
+    ss = TRAY_SUPERSAMPLE
+
+    def render(width: int, height: int) -> np.ndarray:
+        # At 32px the antialias band is about one pixel wide, so render at
+        # ss x ss samples per pixel and box-filter down instead.
+        u, v = uv_grid(width * ss, height * ss)
+        aa = 1.0 / float(size * ss)
         glyph = prompt_mark_alpha(u, v, thickness=0.205, dot_radius=0.076, aa=aa)
         spark = sparkle_alpha(u, v, cx=0.88, cy=0.32, size=0.11, thickness=0.045, aa=aa)
-        mask = max(glyph, spark)
-        if mask <= 0.0:
-            return (0, 0, 0, 0)
+        mask = np.maximum(glyph, spark)
         gt = clamp01((u - 0.28) / 0.62)
-        fg = accent.mix(accent_2, gt).mix(white, 0.28)
-        return (int(fg.r + 0.5), int(fg.g + 0.5), int(fg.b + 0.5), int(255 * mask + 0.5))
+        fg = mix(mix(ACCENT, ACCENT_2, gt), WHITE, 0.28)
+
+        # Average premultiplied color so transparent samples don't darken edges.
+        alpha = area_average(mask, ss)
+        covered = alpha > 0.0
+        fg = tuple(
+            np.divide(area_average(c * mask, ss), alpha, out=np.zeros_like(alpha), where=covered)
+            for c in fg
+        )
+        return to_rgba8(fg, 255.0 * alpha)
 
-    write_png_rgba(path, size, size, pixel)
+    write_png_rgba(path, size, size, render, compress_level)
 
 
 def main() -> None:
     repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
     app_icon_src = os.path.join(repo_root, "src-tauri", "app-icon.png")
     tray_icon = os.path.join(repo_root, "src-tauri", "icons", "tray.png")
+    # Fast deflate by default; set ICON_PNG_LEVEL=9 for the smallest release assets.
+    level = int(os.environ.get("ICON_PNG_LEVEL", zlib.Z_BEST_SPEED))
 
     print("Generating app icon:", os.path.relpath(app_icon_src, repo_root))
-    build_app_icon(app_icon_src, size=1024)
+    build_app_icon(app_icon_src, size=1024, compress_level=level)
     print("Generating tray icon:", os.path.relpath(tray_icon, repo_root))
-    build_tray_icon(tray_icon, size=32)
+    build_tray_icon(tray_icon, size=32, compress_level=level)
     print("Done.")
 
 